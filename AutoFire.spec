@@ -10,7 +10,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=['pytest', 'test_autofire_ui_tk', 'test_multi_slot', 'test_autofire_runner'],
+    excludes=['pytest', 'test_autofire_ui_tk', 'test_multi_slot', '_fakes'],
     noarchive=False,
     optimize=0,
 )
@@ -332,7 +332,7 @@ class AutoFireEngine:
         
         # Stop all active slots
         with self._lock:
-            for trigger_key in list(self._slot_states.keys()):
+            for trigger_key in self._slot_states:
                 self._slot_states[trigger_key] = False
         
         # Wait for threads to finish
@@ -540,6 +540,19 @@ class AutoFireUI:
         self.window_title_var = tk.StringVar(root)
         self.use_sendinput_var = tk.BooleanVar(root)
 
+        # Set whenever a slot field var is written; cleared once the vars and
+        # the current slot are known to match again.
+        self._slot_dirty = False
+        for var in (
+            self.trigger_var,
+            self.output_var,
+            self.interval_var,
+            self.pass_var,
+            self.window_title_var,
+            self.use_sendinput_var,
+        ):
+            var.trace_add("write", self._mark_slot_dirty)
+
         self.status_var = tk.StringVar(root)
         
         # Language settings
@@ -552,6 +565,7 @@ class AutoFireUI:
         # Multi-slot management
         self.config = AutoFireConfig()
         self.current_slot_index = 0
+        self._slot_list_rows: list[str] = []
 
         self._build_layout()
         config = load_config()
@@ -735,13 +749,22 @@ class AutoFireUI:
         if not hasattr(self, 'slot_listbox') or self.slot_listbox is None:
             return
             
-        self.slot_listbox.delete(0, tk.END)
+        rows = []
         for i, slot in enumerate(self.config.slots):
             status = "✓" if slot.enabled else "✗"
             display = f"{status} [{i+1}] {slot.trigger_key.upper()} → {slot.output_key.upper()} @{slot.interval_ms}ms"
             if slot.window_title:
                 display += f" ({slot.window_title[:15]}...)" if len(slot.window_title) > 15 else f" ({slot.window_title})"
-            self.slot_listbox.insert(tk.END, display)
+            rows.append(display)
+
+        # Only rebuild the listbox when the rendered rows actually changed
+        if rows != self._slot_list_rows:
+            self.slot_listbox.delete(0, tk.END)
+            if rows:
+                self.slot_listbox.insert(tk.END, *rows)
+            self._slot_list_rows = rows
+        else:
+            self.slot_listbox.selection_clear(0, tk.END)
         
         # Select current slot
         if 0 <= self.current_slot_index < len(self.config.slots):
@@ -764,18 +787,8 @@ class AutoFireUI:
             new_index = self.current_slot_index
         
         # Save current UI values to old slot before switching
-        if 0 <= old_index < len(self.config.slots) and old_index != new_index:
-            slot = self.config.slots[old_index]
-            slot.trigger_key = self.trigger_var.get().strip().lower()
-            slot.output_key = self.output_var.get().strip().lower()
-            try:
-                interval = max(MIN_INTERVAL_MS, min(MAX_INTERVAL_MS, self.interval_var.get()))
-                slot.interval_ms = interval
-            except (ValueError, tk.TclError):
-                slot.interval_ms = 50
-            slot.window_title = self.window_title_var.get().strip()
-            slot.pass_through = self.pass_var.get()
-            slot.use_sendinput = self.use_sendinput_var.get()
+        if self._slot_dirty and 0 <= old_index < len(self.config.slots) and old_index != new_index:
+            self._write_vars_to_slot(self.config.slots[old_index])
             
         self.current_slot_index = new_index
         
@@ -789,21 +802,30 @@ class AutoFireUI:
             self.pass_var.set(slot.pass_through)
             self.use_sendinput_var.set(slot.use_sendinput)
             self.ui_elements['enabled_check'].state(['selected' if slot.enabled else '!selected'])
+            self._slot_dirty = False
     
     def _save_current_slot_to_config(self) -> None:
         """Save current UI values to the current slot in config."""
+        if not self._slot_dirty:
+            return
         if 0 <= self.current_slot_index < len(self.config.slots):
-            slot = self.config.slots[self.current_slot_index]
-            slot.trigger_key = self.trigger_var.get().strip().lower()
-            slot.output_key = self.output_var.get().strip().lower()
-            try:
-                interval = max(MIN_INTERVAL_MS, min(MAX_INTERVAL_MS, self.interval_var.get()))
-                slot.interval_ms = interval
-            except (ValueError, tk.TclError):
-                slot.interval_ms = 50
-            slot.window_title = self.window_title_var.get().strip()
-            slot.pass_through = self.pass_var.get()
-            slot.use_sendinput = self.use_sendinput_var.get()
+            self._write_vars_to_slot(self.config.slots[self.current_slot_index])
+
+    def _write_vars_to_slot(self, slot: AutoFireSlot) -> None:
+        slot.trigger_key = self.trigger_var.get().strip().lower()
+        slot.output_key = self.output_var.get().strip().lower()
+        try:
+            interval = max(MIN_INTERVAL_MS, min(MAX_INTERVAL_MS, self.interval_var.get()))
+            slot.interval_ms = interval
+        except (ValueError, tk.TclError):
+            slot.interval_ms = 50
+        slot.window_title = self.window_title_var.get().strip()
+        slot.pass_through = self.pass_var.get()
+        slot.use_sendinput = self.use_sendinput_var.get()
+        self._slot_dirty = False
+
+    def _mark_slot_dirty(self, *_args: object) -> None:
+        self._slot_dirty = True
             
     def _add_slot(self) -> None:
         """Add a new slot."""
@@ -864,6 +886,7 @@ class AutoFireUI:
         self.pass_var.set(slot.pass_through)
         self.window_title_var.set(slot.window_title)
         self.use_sendinput_var.set(slot.use_sendinput)
+        self._slot_dirty = False
         self.current_language = config.language
         
         # Update enabled checkbox
@@ -942,6 +965,7 @@ class AutoFireUI:
             slot.window_title = window_title
             slot.pass_through = bool(self.pass_var.get())
             slot.use_sendinput = bool(self.use_sendinput_var.get())
+            self._slot_dirty = False
         
         self.config.language = self.current_language
         return self.config
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable, Dict, Iterable, Optional
+from typing import Callable, Container, Dict, Iterable, Optional
 
 import keyboard
 
@@ -16,6 +16,16 @@ MacroResolver = Callable[[str], Optional[Macro]]
 ErrorCallback = Callable[[str], None]
 
 
+def _checked_hotkey(binding: Binding, taken: Container[str]) -> str:
+    """Return the normalized hotkey for ``binding`` or raise if it is empty or in ``taken``."""
+    hotkey = binding.hotkey.lower().strip()
+    if not hotkey:
+        raise ValueError("Binding hotkey cannot be empty")
+    if hotkey in taken:
+        raise ValueError(f"Hotkey '{hotkey}' already in use")
+    return hotkey
+
+
 class BindingRegistry:
     """Registers and manages global hotkeys for macros and system actions."""
 
@@ -38,7 +48,7 @@ class BindingRegistry:
 
     # Management ------------------------------------------------------------------
     def clear(self) -> None:
-        for hotkey, handler_id in list(self._handlers.items()):
+        for hotkey, handler_id in self._handlers.items():
             try:
                 self._keyboard.remove_hotkey(handler_id)
             except Exception:  # noqa: BLE001
@@ -47,23 +57,38 @@ class BindingRegistry:
         self._bindings.clear()
 
     def apply_bindings(self, bindings: Iterable[Binding]) -> None:
-        self.clear()
+        """Register ``bindings``, touching only hotkeys whose registration changed."""
+        desired: Dict[str, Binding] = {}
         for binding in bindings:
             try:
-                self.register(binding)
+                desired[_checked_hotkey(binding, desired)] = binding
             except ValueError as exc:
                 logger.warning("Skipping binding %s: %s", binding.hotkey, exc)
                 self._emit_error(str(exc))
 
+        for hotkey, current in list(self._bindings.items()):
+            wanted = desired.get(hotkey)
+            if wanted is None or wanted.suppress != current.suppress:
+                self.unregister(current)
+
+        for hotkey, binding in desired.items():
+            if hotkey in self._handlers:
+                # The hook only depends on the hotkey and suppress flag; swap the payload in place.
+                self._bindings[hotkey] = binding
+            else:
+                try:
+                    self.register(binding)
+                except ValueError as exc:
+                    logger.warning("Skipping binding %s: %s", binding.hotkey, exc)
+                    self._emit_error(str(exc))
+
     def register(self, binding: Binding) -> None:
-        hotkey = binding.hotkey.lower().strip()
-        if not hotkey:
-            raise ValueError("Binding hotkey cannot be empty")
-        if hotkey in self._handlers:
-            raise ValueError(f"Hotkey '{hotkey}' already in use")
+        hotkey = _checked_hotkey(binding, self._handlers)
 
         def callback() -> None:
-            self._invoke_binding(binding)
+            current = self._bindings.get(hotkey)
+            if current is not None:
+                self._invoke_binding(current)
 
         handler_id = self._keyboard.add_hotkey(hotkey, callback, suppress=binding.suppress)
         self._handlers[hotkey] = handler_id
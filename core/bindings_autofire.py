@@ -139,7 +139,7 @@ class AutoFireBindingRegistry:
 
     # Lifecycle -----------------------------------------------------------------
     def clear(self) -> None:
-        for handle in list(self._handles.values()):
+        for handle in self._handles.values():
             self._teardown_handle(handle)
         self._handles.clear()
         if self._emergency_hotkey_id is not None:
@@ -1,7 +1,7 @@
 """Core data types and schema utilities for the macro application."""
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
@@ -47,6 +47,24 @@ class BindingType(str, Enum):
     AUTOFIRE = "autofire"
 
 
+_KEY_ACTIONS_BY_VALUE = {action.value: action for action in KeyAction}
+_MOUSE_ACTIONS_BY_VALUE = {action.value: action for action in MouseAction}
+
+
+def _key_action(value: Any) -> KeyAction:
+    action = _KEY_ACTIONS_BY_VALUE.get(value) if isinstance(value, str) else None
+    if action is None:
+        raise ValueError(f"{value!r} is not a valid KeyAction")
+    return action
+
+
+def _mouse_action(value: Any) -> MouseAction:
+    action = _MOUSE_ACTIONS_BY_VALUE.get(value) if isinstance(value, str) else None
+    if action is None:
+        raise ValueError(f"{value!r} is not a valid MouseAction")
+    return action
+
+
 @dataclass(slots=True)
 class BaseEvent:
     id: str
@@ -67,6 +85,18 @@ class KeyEvent(BaseEvent):
     scan_code: Optional[int]
     action: KeyAction
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind.value,
+            "delay_ms": self.delay_ms,
+            "timestamp_ns": self.timestamp_ns,
+            "key": self.key,
+            "scan_code": self.scan_code,
+            "action": self.action.value,
+            "type": "KeyEvent",
+        }
+
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "KeyEvent":
         return KeyEvent(
@@ -76,7 +106,7 @@ class KeyEvent(BaseEvent):
             timestamp_ns=int(data.get("timestamp_ns", 0)),
             key=str(data.get("key", "")),
             scan_code=data.get("scan_code"),
-            action=KeyAction(data.get("action", KeyAction.DOWN.value)),
+            action=_key_action(data.get("action", KeyAction.DOWN.value)),
         )
 
 
@@ -88,6 +118,20 @@ class MouseEvent(BaseEvent):
     y: Optional[int]
     delta: Optional[int]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind.value,
+            "delay_ms": self.delay_ms,
+            "timestamp_ns": self.timestamp_ns,
+            "action": self.action.value,
+            "button": self.button,
+            "x": self.x,
+            "y": self.y,
+            "delta": self.delta,
+            "type": "MouseEvent",
+        }
+
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "MouseEvent":
         return MouseEvent(
@@ -95,7 +139,7 @@ class MouseEvent(BaseEvent):
             kind=EventKind.MOUSE,
             delay_ms=int(data.get("delay_ms", 0)),
             timestamp_ns=int(data.get("timestamp_ns", 0)),
-            action=MouseAction(data.get("action", MouseAction.MOVE.value)),
+            action=_mouse_action(data.get("action", MouseAction.MOVE.value)),
             button=data.get("button"),
             x=data.get("x"),
             y=data.get("y"),
@@ -181,6 +225,15 @@ class Macro:
             playback=playback,
         )
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Macro":
+        # Events and playback options only hold immutable values, so a flat copy of each is a deep copy.
+        return Macro(
+            id=self.id,
+            name=self.name,
+            events=[replace(event) for event in self.events],
+            playback=replace(self.playback),
+        )
+
 
 @dataclass(slots=True)
 class Binding:
@@ -215,6 +268,9 @@ class Binding:
             suppress=bool(data.get("suppress", True)),
         )
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Binding":
+        return replace(self, playback=replace(self.playback))
+
 
 @dataclass(slots=True)
 class AutoFireBinding:
@@ -1,36 +1,58 @@
+"""Keyboard, clock and ctypes test doubles shared by the UI test modules."""
 from __future__ import annotations
 
-from unittest.mock import call
-import time
+from collections import defaultdict
+import sys
 from typing import Callable
 
 
 class FakeClock:
+    __slots__ = ("_now_ns",)
+
     def __init__(self, now: float = 0.0):
-        self._now = now
+        self._now_ns = round(now * 1_000_000_000)
 
     def now(self) -> float:
-        return self._now
+        return self._now_ns / 1_000_000_000
 
     def sleep(self, seconds: float) -> None:
-        self._now += seconds
+        self._now_ns += round(seconds * 1_000_000_000)
 
     def advance(self, seconds: float) -> None:
-        self._now += seconds
+        self._now_ns += round(seconds * 1_000_000_000)
+
+    def advance_ms(self, ms: int) -> None:
+        self._now_ns += ms * 1_000_000
+
 
+def _normalize_key(key: str) -> str:
+    return sys.intern(str(key or "").strip().lower())
 
-def advance_in_steps(clock: FakeClock, total_ms: int, step_ms: int) -> None:
-    """Advances the clock in smaller steps to allow other events to process."""
-    total_secs = total_ms / 1000.0
-    step_secs = step_ms / 1000.0
-    end_time = clock.now() + total_secs
 
-    while clock.now() < end_time:
-        clock.advance(min(step_secs, end_time - clock.now()))
-        time.sleep(0)  # Yield to other threads/events if necessary in a real scenario
+class FakeKeyboardEvent:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
 
 
 class FakeKeyboard:
+    __slots__ = (
+        "press_calls",
+        "release_calls",
+        "block_calls",
+        "unblock_calls",
+        "hotkey_hooks",
+        "key_hooks",
+        "_is_pressed_map",
+        "_block_depth",
+        "_clock",
+        "hook_key_calls",
+        "add_hotkey_calls",
+        "remove_hotkey_calls",
+        "write_calls",
+    )
+
     def __init__(self) -> None:
         self.press_calls: list[str] = []
         self.release_calls: list[str] = []
@@ -39,49 +61,65 @@ class FakeKeyboard:
         self.hotkey_hooks: dict[str, Callable[[], None]] = {}
         self.key_hooks: dict[str, tuple[Callable, bool]] = {}
         self._is_pressed_map: dict[str, bool] = {}
+        self._block_depth: defaultdict[str, int] = defaultdict(int)
         self._clock: FakeClock | None = None
-        self._async_callbacks = True
-        self.hook_key_calls: list = []  # Add this line
+        self.hook_key_calls: list[tuple[str, Callable, bool]] = []
+        self.add_hotkey_calls: list[tuple[str, bool]] = []
+        self.remove_hotkey_calls: list[str] = []
+        self.write_calls: list[str] = []
 
     def attach_clock(self, clock: FakeClock) -> None:
         self._clock = clock
 
-    def set_async_callbacks(self, is_async: bool) -> None:
-        self._async_callbacks = is_async
-
     def press(self, key: str) -> None:
         self.press_calls.append(key)
 
     def release(self, key: str) -> None:
         self.release_calls.append(key)
 
+    def write(self, text: str) -> None:
+        self.write_calls.append(text)
+
     def block_key(self, key: str) -> None:
+        key = _normalize_key(key)
         self.block_calls.append(key)
+        self._block_depth[key] += 1
 
     def unblock_key(self, key: str) -> None:
+        key = _normalize_key(key)
         self.unblock_calls.append(key)
+        self._block_depth[key] -= 1
 
-    def add_hotkey(self, hotkey: str, callback: Callable[[], None], suppress: bool = False) -> None:  # noqa
+    def add_hotkey(self, hotkey: str, callback: Callable[[], None], suppress: bool = False) -> str:  # noqa
+        """Records the hotkey and returns it as the removal handle."""
+        hotkey = _normalize_key(hotkey)
         self.hotkey_hooks[hotkey] = callback
+        self.add_hotkey_calls.append((hotkey, suppress))
+        return hotkey
 
     def remove_hotkey(self, hotkey: str | list) -> None:
         if isinstance(hotkey, list):
             hotkey = hotkey[0]  # simplified for test
+        hotkey = _normalize_key(hotkey)
+        self.remove_hotkey_calls.append(hotkey)
         if hotkey in self.hotkey_hooks:
             del self.hotkey_hooks[hotkey]
 
     def on_press_key(self, key: str, callback: Callable, suppress: bool = False) -> None:
         """Records the hook registration."""
+        key = _normalize_key(key)
         self.key_hooks[key] = (callback, suppress)
-        self.hook_key_calls.append(call(key, callback, suppress=suppress))
+        self.hook_key_calls.append((key, callback, suppress))
 
     def on_release_key(self, key: str, callback: Callable, suppress: bool = False) -> None:
         """Records the release hook registration."""
-        release_key = f"release:{key}"
+        key = _normalize_key(key)
+        release_key = sys.intern(f"release:{key}")
         self.key_hooks[release_key] = (callback, suppress)
-        self.hook_key_calls.append(call(key, callback, suppress=suppress))
+        self.hook_key_calls.append((key, callback, suppress))
 
     def unhook_key(self, key: str) -> None:
+        key = _normalize_key(key)
         if key in self.key_hooks:
             del self.key_hooks[key]
 
@@ -90,38 +128,47 @@ class FakeKeyboard:
         self.key_hooks.clear()
 
     def is_pressed(self, key: str) -> bool:
-        return self._is_pressed_map.get(key, False)
+        return self._is_pressed_map.get(_normalize_key(key), False)
 
     def clear_calls(self) -> None:
         self.press_calls.clear()
         self.release_calls.clear()
         self.block_calls.clear()
         self.unblock_calls.clear()
+        self._block_depth.clear()
         self.hook_key_calls.clear()
+        self.add_hotkey_calls.clear()
+        self.remove_hotkey_calls.clear()
+        self.write_calls.clear()
 
     def has_active_hooks(self) -> bool:
         return bool(self.hotkey_hooks or self.key_hooks)
 
     def is_blocked(self, key: str) -> bool:
-        return self.block_calls.count(key) > self.unblock_calls.count(key)
+        return self._block_depth.get(_normalize_key(key), 0) > 0
 
     def simulate_keydown(self, key: str) -> None:
+        key = _normalize_key(key)
         self._is_pressed_map[key] = True
-        event = type("KeyboardEvent", (), {"name": key})
-        if key in self.key_hooks:
-            self.key_hooks[key][0](event)
-        if key in self.hotkey_hooks:
-            self.hotkey_hooks[key]()
+        press_hook = self.key_hooks.get(key)
+        if press_hook is not None:
+            press_hook[0](FakeKeyboardEvent(key))
+        hotkey_callback = self.hotkey_hooks.get(key)
+        if hotkey_callback is not None:
+            hotkey_callback()
 
     def simulate_keyup(self, key: str) -> None:
+        key = _normalize_key(key)
         self._is_pressed_map[key] = False
-        release_hook = f"release:{key}"
-        if release_hook in self.key_hooks:
-            event = type("KeyboardEvent", (), {"name": key})
-            self.key_hooks[release_hook][0](event)
+        release_hook = sys.intern(f"release:{key}")
+        hook = self.key_hooks.get(release_hook)
+        if hook is not None:
+            hook[0](FakeKeyboardEvent(key))
 
 
 class FakeCtypes:
+    __slots__ = ("post_message_calls", "target_hwnd", "target_window_title")
+
     def __init__(self):
         self.post_message_calls = []
         self.target_hwnd = 12345
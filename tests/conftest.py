@@ -6,3 +6,21 @@ def add_project_root_to_path(monkeypatch):
     from pathlib import Path
     project_root = Path(__file__).parent.parent
     monkeypatch.syspath_prepend(str(project_root))
+
+
+@pytest.fixture
+def fake_clock():
+    from tests._fakes import FakeClock
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_keyboard():
+    from tests._fakes import FakeKeyboard
+    return FakeKeyboard()
+
+
+@pytest.fixture
+def fake_ctypes():
+    from tests._fakes import FakeCtypes
+    return FakeCtypes()
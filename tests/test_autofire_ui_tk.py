@@ -3,14 +3,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # ruff: noqa: E501
-import tkinter as tk
-from tkinter import messagebox
 from typing import Generator
 from unittest.mock import MagicMock, call
 import time
 
 import pytest
 
+if sys.platform != "win32":
+    pytest.skip("AutoFireUI is Windows-only", allow_module_level=True)
+tk = pytest.importorskip("tkinter")
+from tkinter import messagebox
+
 import autofire_ui
 from autofire_ui import (
     MIN_INTERVAL_MS,
@@ -21,7 +24,9 @@ from autofire_ui import (
     WM_KEYDOWN,
     WM_KEYUP,
 )
-from tests.test_autofire_runner import FakeClock, FakeKeyboard, FakeCtypes
+from tests._fakes import FakeClock, FakeKeyboard, FakeCtypes
+
+_VK_R = autofire_ui.VK_CODES["r"]
 
 
 class UIHarness:
@@ -45,11 +50,10 @@ class UIHarness:
                 self.ui._update_status_display(state, config)
         self.ui.root.update()
 
-    def advance(self, duration_ms: int, step_ms: int = 1) -> None:
-        """Advance the clock and pump the UI."""
-        for _ in range(0, duration_ms, step_ms):
-            self.clock.advance(step_ms / 1000.0)
-            self.pump()
+    def advance(self, duration_ms: int) -> None:
+        """Advance the clock in one jump, then pump the UI."""
+        self.clock.advance_ms(duration_ms)
+        self.pump()
 
     def close(self) -> None:
         """Close the UI."""
@@ -57,11 +61,27 @@ class UIHarness:
 
     def wait_for_status(self, status_substring: str, timeout_ms: int = 1000) -> bool:
         """Wait until the status label contains the given substring."""
-        for _ in range(timeout_ms):
-            self.pump()
-            if status_substring in self.ui.status_var.get():
-                return True
-            self.clock.advance(0.001)
+        pump = self.pump
+        advance_ms = self.clock.advance_ms
+        status_var = self.ui.status_var
+        changed = True
+
+        def on_write(*_args: object) -> None:
+            nonlocal changed
+            changed = True
+
+        # Only re-read the label after Tk reports a write to it.
+        trace_id = status_var.trace_add("write", on_write)
+        try:
+            for _ in range(timeout_ms):
+                pump()
+                if changed:
+                    changed = False
+                    if status_substring in status_var.get():
+                        return True
+                advance_ms(1)
+        finally:
+            status_var.trace_remove("write", trace_id)
         # To aid debugging, print the final status if the wait fails.
         print(f"wait_for_status timed out. Final status: '{self.ui.status_var.get()}'")
         return False
@@ -83,13 +103,13 @@ def root_window() -> Generator[tk.Tk, None, None]:
 
 @pytest.fixture
 def ui_harness(
-    monkeypatch: pytest.MonkeyPatch, root_window: tk.Tk
+    monkeypatch: pytest.MonkeyPatch,
+    root_window: tk.Tk,
+    fake_clock: FakeClock,
+    fake_keyboard: FakeKeyboard,
+    fake_ctypes: FakeCtypes,
 ) -> Generator[UIHarness, None, None]:
     """Fixture to create a UI harness with mocked dependencies."""
-    fake_clock = FakeClock()
-    fake_keyboard = FakeKeyboard()
-    fake_ctypes = FakeCtypes()
-
     saved_configs: list[AutoFireConfig] = []
 
     def mock_save_config(config: AutoFireConfig) -> None:
@@ -204,25 +224,18 @@ def test_trigger_press_runs_until_release(ui_harness: UIHarness) -> None:
     harness.keyboard.simulate_keydown("e")
     assert harness.wait_for_status("Active: E", timeout_ms=1000)
 
-    harness.advance(50, 5)
+    harness.advance(50)
 
     harness.keyboard.simulate_keyup("e")
     assert harness.wait_for_status("Running")
 
-    output_vk = autofire_ui.VK_CODES["r"]
-    keydown_events = [
-        call
-        for call in harness.ctypes.post_message_calls
-        if call[1] == WM_KEYDOWN and call[2] == output_vk
-    ]
-    keyup_events = [
-        call
-        for call in harness.ctypes.post_message_calls
-        if call[1] == WM_KEYUP and call[2] == output_vk
-    ]
-
-    assert len(keydown_events) > 0
-    assert len(keydown_events) == len(keyup_events)
+    target_hwnd = harness.ctypes.target_hwnd
+    post_message_calls = harness.ctypes.post_message_calls
+    keydown_count = post_message_calls.count((target_hwnd, WM_KEYDOWN, _VK_R, 0))
+    keyup_count = post_message_calls.count((target_hwnd, WM_KEYUP, _VK_R, 0))
+
+    assert keydown_count > 0
+    assert keydown_count == keyup_count
     assert all(
         call[0] == harness.ctypes.target_hwnd for call in harness.ctypes.post_message_calls
     )
@@ -237,7 +250,7 @@ def test_start_fails_if_window_not_found(ui_harness: UIHarness) -> None:
     harness.pump()
 
     harness.keyboard.simulate_keydown("e")
-    harness.advance(50, 10)
+    harness.advance(50)
 
     assert harness.wait_for_status("Active: E", timeout_ms=1000)
     assert not harness.messagebox_calls
@@ -255,8 +268,8 @@ def test_pass_through_modes_control_blocking(ui_harness: UIHarness) -> None:
     assert harness.wait_for_status("Running")
 
     assert len(harness.keyboard.hook_key_calls) > 0
-    for c in harness.keyboard.hook_key_calls:
-        assert c.kwargs["suppress"] is False
+    for _key, _callback, suppress in harness.keyboard.hook_key_calls:
+        assert suppress is False
 
     harness.ui.stop_autofire()
     harness.pump()
@@ -269,8 +282,8 @@ def test_pass_through_modes_control_blocking(ui_harness: UIHarness) -> None:
     assert harness.wait_for_status("Running")
 
     assert len(harness.keyboard.hook_key_calls) > 0
-    for c in harness.keyboard.hook_key_calls:
-        assert c.kwargs["suppress"] is True
+    for _key, _callback, suppress in harness.keyboard.hook_key_calls:
+        assert suppress is True
 
 
 def test_capture_buttons_update_entries(ui_harness: UIHarness) -> None:
@@ -320,13 +333,13 @@ def test_start_stop_buttons_reflect_status(ui_harness: UIHarness) -> None:
     harness.keyboard.simulate_keydown("e")
     assert harness.wait_for_status("Active: E")
 
-    harness.advance(30, 5)
+    harness.advance(30)
     harness.keyboard.simulate_keyup("e")
-    harness.advance(20, 5)
+    harness.advance(20)
     assert harness.wait_for_status("Running")
 
     harness.ui.stop_autofire()
-    harness.advance(20, 5)
+    harness.advance(20)
     assert harness.wait_for_status("Stopped")
     assert harness.ui.ui_elements['start_button'].instate(["!disabled"])
     assert harness.ui.ui_elements['stop_button'].instate(["disabled"])
@@ -343,7 +356,7 @@ def test_on_close_unhooks_and_clears_state(ui_harness: UIHarness) -> None:
     assert harness.wait_for_status("Active: E")
 
     harness.keyboard.simulate_keyup("e")
-    harness.advance(10, 5)
+    harness.advance(10)
     harness.close()
 
     assert not harness.keyboard.has_active_hooks()
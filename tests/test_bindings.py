@@ -0,0 +1,86 @@
+"""Tests for diff-based hotkey registration in BindingRegistry."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from core.bindings import BindingRegistry
+from core.types import Binding, BindingType, PlaybackOptions
+
+
+def _text_binding(hotkey: str, payload: str, suppress: bool = True) -> Binding:
+    return Binding(
+        id=f"id-{hotkey}",
+        hotkey=hotkey,
+        binding_type=BindingType.TEXT,
+        target_id=None,
+        payload=payload,
+        playback=PlaybackOptions(),
+        suppress=suppress,
+    )
+
+
+@pytest.fixture
+def errors() -> list:
+    return []
+
+
+@pytest.fixture
+def registry(fake_keyboard, errors) -> BindingRegistry:
+    return BindingRegistry(
+        player=None,
+        system_actions=None,
+        macro_resolver=lambda _macro_id: None,
+        keyboard_module=fake_keyboard,
+        on_error=errors.append,
+    )
+
+
+def test_reapplying_unchanged_bindings_makes_no_keyboard_calls(registry, fake_keyboard):
+    registry.apply_bindings([_text_binding("f1", "a"), _text_binding("f2", "b")])
+    fake_keyboard.clear_calls()
+
+    registry.apply_bindings([_text_binding("f1", "a"), _text_binding("f2", "b")])
+
+    assert fake_keyboard.add_hotkey_calls == []
+    assert fake_keyboard.remove_hotkey_calls == []
+    assert sorted(registry.list_bindings()) == ["f1", "f2"]
+
+
+def test_changed_suppress_flag_rehooks_the_hotkey(registry, fake_keyboard):
+    registry.apply_bindings([_text_binding("f1", "a", suppress=True)])
+    fake_keyboard.clear_calls()
+
+    registry.apply_bindings([_text_binding("f1", "a", suppress=False)])
+
+    assert fake_keyboard.remove_hotkey_calls == ["f1"]
+    assert fake_keyboard.add_hotkey_calls == [("f1", False)]
+
+
+def test_removed_hotkey_is_unhooked(registry, fake_keyboard):
+    registry.apply_bindings([_text_binding("f1", "a"), _text_binding("f2", "b")])
+    fake_keyboard.clear_calls()
+
+    registry.apply_bindings([_text_binding("f1", "a")])
+
+    assert fake_keyboard.remove_hotkey_calls == ["f2"]
+    assert fake_keyboard.add_hotkey_calls == []
+    assert "f2" not in fake_keyboard.hotkey_hooks
+    assert list(registry.list_bindings()) == ["f1"]
+
+
+def test_swapped_payload_is_seen_by_the_existing_hook(registry, fake_keyboard):
+    registry.apply_bindings([_text_binding("f1", "old")])
+    registry.apply_bindings([_text_binding("f1", "new")])
+
+    fake_keyboard.simulate_keydown("f1")
+
+    assert fake_keyboard.write_calls == ["new"]
+
+
+def test_invalid_hotkeys_are_reported_and_skipped(registry, fake_keyboard, errors):
+    registry.apply_bindings([_text_binding("f1", "a"), _text_binding("F1", "dup"), _text_binding("  ", "x")])
+
+    assert errors == ["Hotkey 'f1' already in use", "Binding hotkey cannot be empty"]
+    assert fake_keyboard.add_hotkey_calls == [("f1", True)]
@@ -0,0 +1,160 @@
+"""Tests for the PySide6 main window."""
+import copy
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+import keyboard
+
+from core.types import EventKind, KeyAction, KeyEvent
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def window(qapp, monkeypatch, tmp_path):
+    # The window registers a global emergency hotkey; keep it off the real keyboard hook.
+    monkeypatch.setattr(keyboard, "add_hotkey", lambda *args, **kwargs: "ctrl+alt+esc")
+    monkeypatch.setattr(keyboard, "remove_hotkey", lambda *args, **kwargs: None)
+    from ui.main_window import MainWindow
+
+    main_window = MainWindow(tmp_path / "state.json")
+    yield main_window
+    main_window.close()
+    main_window.deleteLater()
+
+
+def _load_delays(window, delays):
+    macro = window._current_macro()
+    macro.events[:] = [
+        KeyEvent(
+            id=f"event-{index}",
+            kind=EventKind.KEY,
+            delay_ms=delay,
+            timestamp_ns=0,
+            key="a",
+            scan_code=None,
+            action=KeyAction.DOWN,
+        )
+        for index, delay in enumerate(delays)
+    ]
+    window._load_macro_into_timeline(macro)
+    return macro
+
+
+def _drag(window, values, flush_after=()):
+    for value in values:
+        window.scale_slider.setValue(value)
+        if value in flush_after:
+            _flush_scale(window)
+    _flush_scale(window)
+
+
+def _flush_scale(window):
+    if window._scale_timer.isActive():
+        window._scale_timer.stop()
+        window._apply_scale()
+
+
+def test_scale_drag_result_does_not_depend_on_timer_firings(window):
+    macro = _load_delays(window, [0, 33, 70, 101])
+    _drag(window, [110, 120, 130, 140, 150])
+    single_flush = [event.delay_ms for event in macro.events]
+
+    window.scale_slider.setValue(100)
+    _flush_scale(window)
+    _drag(window, [110, 120, 130, 140, 150], flush_after={110, 130, 140})
+    many_flushes = [event.delay_ms for event in macro.events]
+
+    assert single_flush == many_flushes == [0, 50, 105, 152]
+
+
+def test_scale_back_to_start_restores_original_delays(window):
+    macro = _load_delays(window, [0, 33, 70, 101])
+    _drag(window, [90, 75, 60], flush_after={90, 75})
+    window.scale_slider.setValue(100)
+    _flush_scale(window)
+
+    assert [event.delay_ms for event in macro.events] == [0, 33, 70, 101]
+
+
+def test_scale_after_edit_starts_from_the_edited_delays(window):
+    macro = _load_delays(window, [0, 40, 80])
+    _drag(window, [150])
+    model = window.timeline_model
+    model.setData(model.index(1, 8), 10)
+    _drag(window, [200])
+
+    assert [event.delay_ms for event in macro.events] == [0, 13, 160]
+
+
+def test_switching_macros_resets_the_scale(window):
+    first = _load_delays(window, [0, 100, 200])
+    profile = window._current_profile()
+    second = copy.deepcopy(first)
+    second.id = "macro-b"
+    profile.macros.append(second)
+    _drag(window, [150])
+    window.scale_slider.setValue(120)
+
+    window._load_macro_into_timeline(second)
+    assert not window._scale_timer.isActive()
+    assert window.scale_slider.value() == 100
+    assert window.scale_label.text() == "100%"
+
+    _drag(window, [100])
+    assert [event.delay_ms for event in second.events] == [0, 100, 200]
+    assert [event.delay_ms for event in first.events] == [0, 150, 300]
+
+
+@pytest.fixture
+def press_hooks(window, monkeypatch):
+    import ui.main_window
+
+    hooks = []
+    monkeypatch.setattr(keyboard, "on_press_key", lambda key, *args, **kwargs: hooks.append(key) or key)
+    monkeypatch.setattr(keyboard, "on_release_key", lambda key, *args, **kwargs: key)
+    monkeypatch.setattr(keyboard, "unhook", lambda *args, **kwargs: None)
+    monkeypatch.setattr(ui.main_window.QMessageBox, "warning", lambda *args, **kwargs: None)
+    return hooks
+
+
+def _save_autofire(window, trigger="f6", output="a"):
+    window.autofire_editor.trigger_edit.setText(trigger)
+    window.autofire_editor.output_edit.setText(output)
+    window._save_autofire_binding()
+    window._apply_autofire_bindings_now()
+
+
+def test_saving_an_unchanged_autofire_binding_does_not_rehook(window, press_hooks):
+    _save_autofire(window)
+    assert press_hooks == ["f6"]
+
+    _save_autofire(window)
+
+    assert press_hooks == ["f6"]
+
+
+def test_autofire_apply_retries_after_a_failed_registration(window, press_hooks, monkeypatch):
+    def failing_press_key(key, *args, **kwargs):
+        press_hooks.append(key)
+        raise OSError("hook unavailable")
+
+    monkeypatch.setattr(keyboard, "on_press_key", failing_press_key)
+    _save_autofire(window)
+    assert press_hooks == ["f6"]
+
+    monkeypatch.setattr(keyboard, "on_press_key", lambda key, *args, **kwargs: press_hooks.append(key) or key)
+    _save_autofire(window)
+
+    assert press_hooks == ["f6", "f6"]
+    assert "f6" in window.autofire_registry._handles
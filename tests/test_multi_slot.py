@@ -3,11 +3,14 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import tkinter as tk
-from tkinter import messagebox
 from typing import Generator
 import pytest
 
+if sys.platform != "win32":
+    pytest.skip("AutoFireUI is Windows-only", allow_module_level=True)
+tk = pytest.importorskip("tkinter")
+from tkinter import messagebox
+
 import autofire_ui
 from autofire_ui import (
     AutoFireUI,
@@ -16,7 +19,7 @@ from autofire_ui import (
     save_config,
     load_config,
 )
-from tests.test_autofire_runner import FakeKeyboard, FakeCtypes
+from tests._fakes import FakeKeyboard, FakeCtypes
 
 
 @pytest.fixture
@@ -44,11 +47,13 @@ class MultiSlotHarness:
 
 
 @pytest.fixture
-def multi_slot_ui(monkeypatch: pytest.MonkeyPatch, root_window: tk.Tk) -> Generator[MultiSlotHarness, None, None]:
+def multi_slot_ui(
+    monkeypatch: pytest.MonkeyPatch,
+    root_window: tk.Tk,
+    fake_keyboard: FakeKeyboard,
+    fake_ctypes: FakeCtypes,
+) -> Generator[MultiSlotHarness, None, None]:
     """Fixture to create a multi-slot UI harness with mocked dependencies."""
-    fake_keyboard = FakeKeyboard()
-    fake_ctypes = FakeCtypes()
-    
     saved_configs: list[AutoFireConfig] = []
     
     def mock_save_config(config: AutoFireConfig) -> None:
@@ -1,11 +1,11 @@
 """Editor widget for configuring AutoFire bindings."""
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import List, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QItemSelection, Signal, Slot
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QFormLayout,
     QGroupBox,
@@ -14,21 +14,12 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
 from core.types import AutoFireBinding, generate_id
-
-
-@dataclass
-class AutoFireInput:
-    id: str
-    trigger_key: str
-    output_key: str
-    interval_ms: int
-    pass_through: bool
+from ui.models.autofire_model import AutoFireModel
 
 
 class AutoFireEditor(QGroupBox):
@@ -37,18 +28,19 @@ class AutoFireEditor(QGroupBox):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setTitle("AutoFire")
+        self._model = AutoFireModel()
+        self._last_selected_id: Optional[str] = None
         self._build_ui()
-        self._bindings: List[AutoFireBinding] = []
 
     # UI ----------------------------------------------------------------------
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
 
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Trigger", "Output", "Interval (ms)", "Pass-through"])
+        self.table = QTableView()
+        self.table.setModel(self._model)
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         layout.addWidget(self.table)
 
         form = QFormLayout()
@@ -79,105 +71,96 @@ class AutoFireEditor(QGroupBox):
 
     # Data --------------------------------------------------------------------
     def set_bindings(self, bindings: List[AutoFireBinding]) -> None:
-        self._bindings = list(bindings)
-        self._refresh_table()
-        if self.table.rowCount():
+        self._last_selected_id = None
+        self._model.set_bindings(bindings)
+        if self._model.rowCount():
             self.table.selectRow(0)
         else:
             self.clear_fields()
 
     def bindings(self) -> List[AutoFireBinding]:
-        return list(self._bindings)
+        return self._model.bindings()
 
     def selected_binding(self) -> Optional[AutoFireBinding]:
-        rows = self.table.selectionModel().selectedRows() if self.table.selectionModel() else []
-        if not rows:
-            return None
-        row = rows[0].row()
-        if 0 <= row < len(self._bindings):
-            return self._bindings[row]
-        return None
-
-    def collect_input(self) -> AutoFireInput:
-        binding = self.selected_binding()
-        binding_id = binding.id if binding else generate_id()
+        if self._last_selected_id is not None:
+            row = self._model.row_of(self._last_selected_id)
+            if row >= 0:
+                return self._model.binding_at(row)
+        row = self._selected_row()
+        return self._model.binding_at(row) if row >= 0 else None
+
+    def collect_input(self) -> AutoFireBinding:
         trigger = self.trigger_edit.text().strip().lower()
+        if not trigger:
+            raise ValueError("Trigger key is required")
         output = self.output_edit.text().strip().lower()
-        interval = self.interval_spin.value()
-        pass_through = self.pass_check.isChecked()
-        return AutoFireInput(
-            id=binding_id,
+        if not output:
+            raise ValueError("Output key is required")
+        binding = self.selected_binding()
+        return AutoFireBinding(
+            id=binding.id if binding else generate_id(),
             trigger_key=trigger,
             output_key=output,
-            interval_ms=interval,
-            pass_through=pass_through,
-        )
-
-    def update_binding(self, data: AutoFireInput) -> AutoFireBinding:
-        binding = AutoFireBinding(
-            id=data.id,
-            trigger_key=data.trigger_key,
-            output_key=data.output_key,
-            interval_ms=data.interval_ms,
-            pass_through_trigger=data.pass_through,
+            interval_ms=self.interval_spin.value(),
+            pass_through_trigger=self.pass_check.isChecked(),
             mode="whileHeld",
         )
-        existing = next((b for b in self._bindings if b.id == binding.id), None)
-        if existing:
-            index = self._bindings.index(existing)
-            self._bindings[index] = binding
-        else:
-            self._bindings.append(binding)
-        self._refresh_table()
-        self._select_binding(binding.id)
+
+    def update_binding(self, binding: AutoFireBinding) -> AutoFireBinding:
+        row = self._model.row_of(binding.id)
+        existing = self._model.binding_at(row)
+        if existing is not None and existing == binding:
+            # Nothing changed since the last save; keep the current row as is.
+            self.table.selectRow(row)
+            return existing
+        row = self._model.upsert(binding)
+        self.table.selectRow(row)
         return binding
 
     def remove_selected(self) -> Optional[AutoFireBinding]:
-        binding = self.selected_binding()
+        row = self._selected_row()
+        binding = self._model.remove_row(row) if row >= 0 else None
         if binding:
-            self._bindings = [b for b in self._bindings if b.id != binding.id]
-            self._refresh_table()
-            if self._bindings:
-                self._select_binding(self._bindings[0].id)
+            if self._model.rowCount():
+                self.table.selectRow(0)
             else:
                 self.clear_fields()
         return binding
 
     def load_binding_into_form(self, binding: AutoFireBinding) -> None:
-        self.trigger_edit.setText(binding.trigger_key.upper())
-        self.output_edit.setText(binding.output_key.upper())
-        self.interval_spin.setValue(binding.interval_ms)
-        self.pass_check.setChecked(binding.pass_through_trigger)
+        trigger = binding.trigger_key.upper()
+        if self.trigger_edit.text() != trigger:
+            self.trigger_edit.setText(trigger)
+        output = binding.output_key.upper()
+        if self.output_edit.text() != output:
+            self.output_edit.setText(output)
+        if self.interval_spin.value() != binding.interval_ms:
+            self.interval_spin.setValue(binding.interval_ms)
+        if self.pass_check.isChecked() != binding.pass_through_trigger:
+            self.pass_check.setChecked(binding.pass_through_trigger)
 
     def clear_fields(self) -> None:
+        self._last_selected_id = None
         self.trigger_edit.clear()
         self.output_edit.clear()
         self.interval_spin.setValue(50)
         self.pass_check.setChecked(False)
 
     # Internal -----------------------------------------------------------------
-    def _refresh_table(self) -> None:
-        self.table.blockSignals(True)
-        self.table.setRowCount(len(self._bindings))
-        for row, binding in enumerate(self._bindings):
-            self.table.setItem(row, 0, QTableWidgetItem(binding.trigger_key.upper()))
-            self.table.setItem(row, 1, QTableWidgetItem(binding.output_key.upper()))
-            self.table.setItem(row, 2, QTableWidgetItem(str(binding.interval_ms)))
-            self.table.setItem(row, 3, QTableWidgetItem("ON" if binding.pass_through_trigger else "OFF"))
-            for column in range(4):
-                item = self.table.item(row, column)
-                if item:
-                    item.setFlags(item.flags() ^ Qt.ItemIsEditable)
-        self.table.blockSignals(False)
-
-    def _on_selection_changed(self) -> None:
-        binding = self.selected_binding()
-        if binding:
-            self.load_binding_into_form(binding)
-            self.bindingSelected.emit(binding.id)
-
-    def _select_binding(self, binding_id: str) -> None:
-        for row, binding in enumerate(self._bindings):
-            if binding.id == binding_id:
-                self.table.selectRow(row)
-                break
\ No newline at end of file
+    def _selected_row(self) -> int:
+        selection = self.table.selectionModel()
+        rows = selection.selectedRows() if selection else []
+        return rows[0].row() if rows else -1
+
+    @Slot(QItemSelection, QItemSelection)
+    def _on_selection_changed(self, _selected: QItemSelection, _deselected: QItemSelection) -> None:
+        row = self._selected_row()
+        binding = self._model.binding_at(row) if row >= 0 else None
+        if binding is None:
+            self._last_selected_id = None
+            return
+        if binding.id == self._last_selected_id:
+            return
+        self._last_selected_id = binding.id
+        self.load_binding_into_form(binding)
+        self.bindingSelected.emit(binding.id)
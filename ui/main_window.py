@@ -1,14 +1,17 @@
 """Main window for the macro application using PySide6."""
 from __future__ import annotations
 
+import copy
 import logging
 import time
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
 import keyboard
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QItemSelection, QSignalBlocker, Qt, QTimer, Slot
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QCheckBox,
     QComboBox,
@@ -26,8 +29,7 @@ from PySide6.QtWidgets import (
     QSlider,
     QSpinBox,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -43,7 +45,13 @@ from core.types import (
     Binding,
     BindingType,
     DelayStrategy,
+    EventKind,
+    KeyAction,
+    KeyEvent,
     Macro,
+    MacroEvent,
+    MouseAction,
+    MouseEvent,
     PlaybackMode,
     PlaybackOptions,
     Profile,
@@ -51,6 +59,7 @@ from core.types import (
     generate_id,
     find_profile,
 )
+from ui.models.bindings_model import BindingsModel
 from ui.models.timeline_model import TimelineModel
 from ui.views.timeline_view import TimelineView
 from ui.editor_autofire import AutoFireEditor
@@ -66,6 +75,41 @@ SYSTEM_ACTION_IDS = [
 ]
 
 DELAY_PRESETS = [10, 25, 50, 100]
+SCALE_APPLY_INTERVAL_MS = 50
+
+# Enum-backed combos are filled in enum order, so each member's row is fixed.
+PLAYBACK_MODE_ROWS = {mode: row for row, mode in enumerate(PlaybackMode)}
+BINDING_TYPE_ROWS = {btype: row for row, btype in enumerate(BindingType)}
+
+
+# Enum coercion ----------------------------------------------------------------------
+_BINDING_TYPES_BY_VALUE = {btype.value: btype for btype in BindingType}
+_PLAYBACK_MODES_BY_VALUE = {mode.value: mode for mode in PlaybackMode}
+_DELAY_STRATEGIES_BY_VALUE = {strategy.value: strategy for strategy in DelayStrategy}
+
+
+def _coerce_binding_type(raw: Any) -> BindingType:
+    if isinstance(raw, BindingType):
+        return raw
+    if not isinstance(raw, str):
+        return BindingType.MACRO
+    return _BINDING_TYPES_BY_VALUE.get(raw, BindingType.MACRO)
+
+
+def _coerce_playback_mode(raw: Any) -> PlaybackMode:
+    if isinstance(raw, PlaybackMode):
+        return raw
+    if not isinstance(raw, str):
+        return PlaybackMode.ONCE
+    return _PLAYBACK_MODES_BY_VALUE.get(raw, PlaybackMode.ONCE)
+
+
+def _coerce_delay_strategy(raw: Any) -> DelayStrategy:
+    if isinstance(raw, DelayStrategy):
+        return raw
+    if not isinstance(raw, str):
+        return DelayStrategy.ACTUAL
+    return _DELAY_STRATEGIES_BY_VALUE.get(raw, DelayStrategy.ACTUAL)
 
 
 class MainWindow(QMainWindow):
@@ -76,6 +120,8 @@ class MainWindow(QMainWindow):
         self.state_path = state_path
         self.state = self._load_or_create_state(state_path)
         self._normalize_state()
+        self._profile_index: dict[str, Profile] = {}
+        self._reindex_profiles()
         self.recorder = MacroRecorder()
         self.player = MacroPlayer(state_callback=self._on_player_state)
         self.system_actions = SystemActionExecutor()
@@ -93,14 +139,33 @@ class MainWindow(QMainWindow):
             error_callback=self._on_autofire_error,
             register_emergency=False,
         )
+        self._applied_autofire_fingerprint: Optional[tuple] = None
+        self._autofire_apply_timer = QTimer(self)
+        self._autofire_apply_timer.setSingleShot(True)
+        self._autofire_apply_timer.setInterval(0)
+        self._autofire_apply_timer.timeout.connect(self._apply_autofire_bindings_now)
 
         self.timeline_model = TimelineModel()
+        self._displayed_event: Optional[MacroEvent] = None
+        # Delays and slider percent from before the current run of scaling; every apply scales
+        # from here so the result only depends on the final slider value.
+        self._scale_baseline: Optional[Tuple[List[int], int]] = None
+        self._scale_applied_percent = 100
+        self._applying_scale = False
         self.timeline_view = TimelineView()
         self.timeline_view.setModel(self.timeline_model)
         if self.timeline_view.selectionModel() is not None:
             self.timeline_view.selectionModel().selectionChanged.connect(self._on_timeline_selection)
         self.timeline_model.modelReset.connect(self._on_model_reset)
         self.timeline_model.dataChanged.connect(self._on_timeline_data_changed)
+        for signal in (
+            self.timeline_model.modelReset,
+            self.timeline_model.rowsInserted,
+            self.timeline_model.rowsRemoved,
+            self.timeline_model.rowsMoved,
+            self.timeline_model.layoutChanged,
+        ):
+            signal.connect(self._invalidate_scale_baseline)
 
         self._emergency_hotkey_id = keyboard.add_hotkey(
             "ctrl+alt+esc", self._on_emergency_stop, suppress=False
@@ -108,8 +173,6 @@ class MainWindow(QMainWindow):
 
         self._build_ui()
         self._refresh_profiles()
-        self._refresh_bindings_table()
-        self._refresh_autofire_editor()
         self._update_transport_from_macro(self._current_macro())
 
     # UI construction -------------------------------------------------------------
@@ -153,7 +216,7 @@ class MainWindow(QMainWindow):
         header.addWidget(QLabel("Delay Presets:"))
         for preset in DELAY_PRESETS:
             button = QPushButton(f"{preset} ms")
-            button.clicked.connect(lambda _, value=preset: self._apply_delay_preset(value))
+            button.clicked.connect(partial(self._apply_delay_preset, preset))
             header.addWidget(button)
         actual_button = QPushButton("Actual")
         actual_button.clicked.connect(self._use_actual_delay)
@@ -165,6 +228,11 @@ class MainWindow(QMainWindow):
         self.scale_slider.setRange(50, 200)
         self.scale_slider.setValue(100)
         self.scale_slider.valueChanged.connect(self._on_scale_changed)
+        # Dragging emits a value per pixel; apply at most one rescale per interval.
+        self._scale_timer = QTimer(self)
+        self._scale_timer.setSingleShot(True)
+        self._scale_timer.setInterval(SCALE_APPLY_INTERVAL_MS)
+        self._scale_timer.timeout.connect(self._apply_scale)
         header.addWidget(self.scale_slider)
         self.scale_label = QLabel("100%")
         header.addWidget(self.scale_label)
@@ -306,11 +374,12 @@ class MainWindow(QMainWindow):
         bindings_group = QGroupBox("Bindings")
         bindings_layout = QVBoxLayout(bindings_group)
 
-        self.binding_table = QTableWidget(0, 4)
-        self.binding_table.setHorizontalHeaderLabels(["Hotkey", "Type", "Target", "Mode"])
+        self.binding_model = BindingsModel()
+        self.binding_table = QTableView()
+        self.binding_table.setModel(self.binding_model)
         self.binding_table.verticalHeader().setVisible(False)
-        self.binding_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.binding_table.itemSelectionChanged.connect(self._on_binding_selected)
+        self.binding_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.binding_table.selectionModel().selectionChanged.connect(self._on_binding_selected)
         bindings_layout.addWidget(self.binding_table)
 
         form = QFormLayout()
@@ -386,15 +455,17 @@ class MainWindow(QMainWindow):
     def _normalize_state(self) -> None:
         for profile in self.state.profiles:
             for binding in profile.bindings:
-                binding.binding_type = self._coerce_binding_type(binding.binding_type)
+                binding.binding_type = _coerce_binding_type(binding.binding_type)
                 if not isinstance(binding.playback, PlaybackOptions):
                     payload = binding.playback if isinstance(binding.playback, dict) else {}
                     binding.playback = PlaybackOptions.from_dict(payload)
-                binding.playback.mode = self._coerce_playback_mode(binding.playback.mode)
-                binding.playback.delay_strategy = self._coerce_delay_strategy(binding.playback.delay_strategy)
+                binding.playback.mode = _coerce_playback_mode(binding.playback.mode)
+                binding.playback.delay_strategy = _coerce_delay_strategy(binding.playback.delay_strategy)
             for macro in profile.macros:
-                macro.playback.mode = self._coerce_playback_mode(macro.playback.mode)
-                macro.playback.delay_strategy = self._coerce_delay_strategy(macro.playback.delay_strategy)
+                macro.playback.mode = _coerce_playback_mode(macro.playback.mode)
+                macro.playback.delay_strategy = _coerce_delay_strategy(macro.playback.delay_strategy)
+            if all(isinstance(binding, AutoFireBinding) for binding in profile.auto_fire_bindings):
+                continue
             normalized_autofire: list[AutoFireBinding] = []
             for binding in profile.auto_fire_bindings:
                 if isinstance(binding, AutoFireBinding):
@@ -403,8 +474,14 @@ class MainWindow(QMainWindow):
                     normalized_autofire.append(AutoFireBinding.from_dict(binding))
             profile.auto_fire_bindings = normalized_autofire
 
+    def _reindex_profiles(self) -> None:
+        self._profile_index = {profile.id: profile for profile in self.state.profiles}
+
     def _current_profile(self) -> Profile:
-        return find_profile(self.state, self.state.active_profile_id)
+        profile = self._profile_index.get(self.state.active_profile_id)
+        if profile is None:
+            return find_profile(self.state, self.state.active_profile_id)
+        return profile
 
     def _current_macro(self) -> Macro:
         profile = self._current_profile()
@@ -418,53 +495,71 @@ class MainWindow(QMainWindow):
         return profile.macros[index]
 
     # Slots -----------------------------------------------------------------------
+    @Slot()
     def _on_profile_changed(self) -> None:
         index = self.profile_combo.currentIndex()
         if index < 0 or index >= len(self.state.profiles):
             return
         self.state.active_profile_id = self.state.profiles[index].id
         self._refresh_profiles()
-        self._refresh_bindings_table()
         self._set_status("Profile switched")
 
     def _refresh_profiles(self) -> None:
-        self.profile_combo.blockSignals(True)
-        self.profile_combo.clear()
-        for profile in self.state.profiles:
-            self.profile_combo.addItem(profile.name, profile.id)
-        active_id = self.state.active_profile_id
-        active_index = next((i for i, p in enumerate(self.state.profiles) if p.id == active_id), 0)
-        self.profile_combo.setCurrentIndex(active_index)
-        self.profile_combo.blockSignals(False)
-        self._refresh_macro_list()
-        self.blocklist_edit.setText(", ".join(self._current_profile().blocklist))
-        self.binding_registry.apply_bindings(self._current_profile().bindings)
-        self._refresh_autofire_editor()
+        # Repaint once after the whole cascade instead of once per widget mutation.
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.profile_combo):
+                self.profile_combo.clear()
+                for profile in self.state.profiles:
+                    self.profile_combo.addItem(profile.name, profile.id)
+                active_id = self.state.active_profile_id
+                active_index = next((i for i, p in enumerate(self.state.profiles) if p.id == active_id), 0)
+                self.profile_combo.setCurrentIndex(active_index)
+            self._refresh_macro_list()
+            self.blocklist_edit.setText(", ".join(self._current_profile().blocklist))
+            self._refresh_bindings_table()
+            self._refresh_autofire_editor()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _refresh_macro_list(self) -> None:
         profile = self._current_profile()
-        self.macro_list.blockSignals(True)
-        previous_id = None
-        current_item = self.macro_list.currentItem()
-        if current_item is not None:
-            previous_id = current_item.data(Qt.UserRole)
-        self.macro_list.clear()
-        for macro in profile.macros:
-            item = QListWidgetItem(macro.name)
-            item.setData(Qt.UserRole, macro.id)
-            self.macro_list.addItem(item)
-        if profile.macros:
-            next_index = 0
-            if previous_id:
-                next_index = next(
-                    (i for i, macro in enumerate(profile.macros) if macro.id == previous_id),
-                    0,
-                )
-            self.macro_list.setCurrentRow(next_index)
-        self.macro_list.blockSignals(False)
+        with QSignalBlocker(self.macro_list):
+            self.macro_list.setUpdatesEnabled(False)
+            try:
+                previous_id = None
+                current_item = self.macro_list.currentItem()
+                if current_item is not None:
+                    previous_id = current_item.data(Qt.UserRole)
+                # Rewrite existing rows in place and only add/remove the difference.
+                existing = self.macro_list.count()
+                for row, macro in enumerate(profile.macros):
+                    if row < existing:
+                        item = self.macro_list.item(row)
+                        if item.text() != macro.name:
+                            item.setText(macro.name)
+                        if item.data(Qt.UserRole) != macro.id:
+                            item.setData(Qt.UserRole, macro.id)
+                    else:
+                        item = QListWidgetItem(macro.name)
+                        item.setData(Qt.UserRole, macro.id)
+                        self.macro_list.addItem(item)
+                while self.macro_list.count() > len(profile.macros):
+                    self.macro_list.takeItem(self.macro_list.count() - 1)
+                if profile.macros:
+                    next_index = 0
+                    if previous_id:
+                        next_index = next(
+                            (i for i, macro in enumerate(profile.macros) if macro.id == previous_id),
+                            0,
+                        )
+                    self.macro_list.setCurrentRow(next_index)
+            finally:
+                self.macro_list.setUpdatesEnabled(True)
         self._load_macro_into_timeline(self._current_macro())
 
     def _load_macro_into_timeline(self, macro: Macro) -> None:
+        self._reset_scale()
         self.timeline_model.set_events(macro.events)
         self.macro_name_edit.setText(macro.name)
         self._update_transport_from_macro(macro)
@@ -475,12 +570,13 @@ class MainWindow(QMainWindow):
 
     def _update_transport_from_macro(self, macro: Macro) -> None:
         playback = macro.playback
-        mode_index = self.mode_combo.findData(playback.mode)
+        mode_index = PLAYBACK_MODE_ROWS.get(playback.mode, -1)
         if mode_index >= 0:
             self.mode_combo.setCurrentIndex(mode_index)
         self.repeat_spin.setValue(playback.repeat_count)
         self.speed_spin.setValue(playback.speed_multiplier)
 
+    @Slot(int)
     def _on_macro_selected(self, row: int) -> None:
         profile = self._current_profile()
         if 0 <= row < len(profile.macros):
@@ -488,35 +584,37 @@ class MainWindow(QMainWindow):
             self._load_macro_into_timeline(macro)
             self._set_status(f"Macro '{macro.name}' selected")
 
+    @Slot()
     def _rename_macro(self) -> None:
         macro = self._current_macro()
         new_name = self.macro_name_edit.text().strip() or "Untitled"
         macro.name = new_name
         self._refresh_macro_list()
 
+    @Slot()
     def _add_macro(self) -> None:
         profile = self._current_profile()
         macro = Macro(id=generate_id(), name=f"Macro {len(profile.macros)+1}")
         profile.macros.append(macro)
         self._refresh_macro_list()
-        index = next((i for i, item in enumerate(profile.macros) if item.id == macro.id), len(profile.macros) - 1)
-        self.macro_list.setCurrentRow(index)
+        self.macro_list.setCurrentRow(len(profile.macros) - 1)
         self._refresh_bindings_table()
         self._set_status("Macro added")
 
+    @Slot()
     def _duplicate_macro(self) -> None:
         macro = self._current_macro()
-        clone = Macro.from_dict(macro.to_dict())
+        clone = copy.deepcopy(macro)
         clone.id = generate_id()
         clone.name = f"{macro.name} Copy"
         profile = self._current_profile()
         profile.macros.append(clone)
         self._refresh_macro_list()
-        index = next((i for i, item in enumerate(profile.macros) if item.id == clone.id), len(profile.macros) - 1)
-        self.macro_list.setCurrentRow(index)
+        self.macro_list.setCurrentRow(len(profile.macros) - 1)
         self._refresh_bindings_table()
         self._set_status("Macro duplicated")
 
+    @Slot()
     def _delete_macro(self) -> None:
         profile = self._current_profile()
         row = self.macro_list.currentRow()
@@ -528,46 +626,54 @@ class MainWindow(QMainWindow):
             self._refresh_bindings_table()
             self._set_status("Macro deleted")
 
+    @Slot()
     def _create_profile(self) -> None:
         profile = Profile(id=generate_id(), name=f"Profile {len(self.state.profiles)+1}")
         profile.macros.append(Macro(id=generate_id(), name="Macro 1"))
         self.state.profiles.append(profile)
+        self._profile_index[profile.id] = profile
         self.state.active_profile_id = profile.id
         self._refresh_profiles()
         self._set_status("Profile created")
 
+    @Slot()
     def _duplicate_profile(self) -> None:
         profile = self._current_profile()
         clone = Profile(
             id=generate_id(),
             name=f"{profile.name} Copy",
-            macros=[Macro.from_dict(macro.to_dict()) for macro in profile.macros],
-            bindings=[Binding.from_dict(binding.to_dict()) for binding in profile.bindings],
-            auto_fire_bindings=[AutoFireBinding.from_dict(b.to_dict()) for b in profile.auto_fire_bindings],
+            macros=copy.deepcopy(profile.macros),
+            bindings=copy.deepcopy(profile.bindings),
+            auto_fire_bindings=copy.deepcopy(profile.auto_fire_bindings),
             blocklist=list(profile.blocklist),
         )
         self.state.profiles.append(clone)
+        self._profile_index[clone.id] = clone
         self.state.active_profile_id = clone.id
         self._refresh_profiles()
         self._set_status("Profile duplicated")
 
+    @Slot()
     def _delete_profile(self) -> None:
         if len(self.state.profiles) <= 1:
             QMessageBox.information(self, "Profiles", "At least one profile must exist.")
             return
         profile = self._current_profile()
         self.state.profiles = [p for p in self.state.profiles if p.id != profile.id]
+        del self._profile_index[profile.id]
         self.state.active_profile_id = self.state.profiles[0].id
         self._refresh_profiles()
         self._set_status("Profile deleted")
 
     # Blocklist -------------------------------------------------------------------
+    @Slot()
     def _update_blocklist(self) -> None:
         entries = [token.strip().lower() for token in self.blocklist_edit.text().split(",") if token.strip()]
         self._current_profile().blocklist = entries
         self._set_status("Blocklist updated")
 
     # Recording -------------------------------------------------------------------
+    @Slot()
     def _start_recording(self) -> None:
         if self.recorder.is_recording():
             return
@@ -582,6 +688,7 @@ class MainWindow(QMainWindow):
         except Exception as exc:  # noqa: BLE001
             QMessageBox.warning(self, "Recorder", str(exc))
 
+    @Slot()
     def _stop_recording(self) -> None:
         if not self.recorder.is_recording():
             return
@@ -600,10 +707,11 @@ class MainWindow(QMainWindow):
         self._set_status(f"Recorded {len(events)} events")
 
     # Playback --------------------------------------------------------------------
+    @Slot()
     def _play_macro(self) -> None:
         macro = self._current_macro()
         playback = macro.playback
-        playback.mode = self._coerce_playback_mode(self.mode_combo.currentData())
+        playback.mode = _coerce_playback_mode(self.mode_combo.currentData())
         playback.repeat_count = self.repeat_spin.value()
         playback.speed_multiplier = self.speed_spin.value()
         if playback.mode == PlaybackMode.WHILE_HELD:
@@ -618,6 +726,7 @@ class MainWindow(QMainWindow):
         except RuntimeError as exc:
             QMessageBox.warning(self, "Playback", str(exc))
 
+    @Slot()
     def _stop_playback(self) -> None:
         self.player.stop()
         self._set_status("Stop requested")
@@ -643,121 +752,112 @@ class MainWindow(QMainWindow):
         macro.playback.fixed_delay_ms = value
         self._set_status(f"Delays normalized to {value} ms")
 
+    @Slot()
     def _use_actual_delay(self) -> None:
         macro = self._current_macro()
         macro.playback.delay_strategy = DelayStrategy.ACTUAL
         macro.playback.fixed_delay_ms = None
         self._set_status("Using recorded delays")
 
+    @Slot()
     def _on_scale_changed(self) -> None:
+        self.scale_label.setText(f"{self.scale_slider.value()}%")
+        if not self._scale_timer.isActive():
+            self._scale_timer.start()
+
+    @Slot()
+    def _apply_scale(self) -> None:
         value = self.scale_slider.value()
-        factor = value / 100.0
-        self.scale_label.setText(f"{value}%")
-        self.timeline_model.scale_delays(factor)
+        if self._scale_baseline is None:
+            self._scale_baseline = (self.timeline_model.delays(), self._scale_applied_percent)
+        delays, base_percent = self._scale_baseline
+        self._applying_scale = True
+        try:
+            self.timeline_model.scale_delays(value / base_percent, baseline=delays)
+        finally:
+            self._applying_scale = False
+        self._scale_applied_percent = value
         self._set_status(f"Delays scaled by {value}%")
 
-    def _insert_key_event(self, action: str) -> None:
-        from core.types import KeyAction, KeyEvent, EventKind
+    def _invalidate_scale_baseline(self, *_args) -> None:
+        self._scale_baseline = None
 
-        macro = self._current_macro()
-        new_event = KeyEvent(
-            id=generate_id(),
-            kind=EventKind.KEY,
-            delay_ms=10,
-            timestamp_ns=0,
-            key="space",
-            scan_code=None,
-            action=KeyAction(action),
+    def _reset_scale(self) -> None:
+        # Scale state belongs to the macro being edited; a pending drag must not land on the next one.
+        self._scale_timer.stop()
+        with QSignalBlocker(self.scale_slider):
+            self.scale_slider.setValue(100)
+        self.scale_label.setText("100%")
+        self._scale_applied_percent = 100
+        self._scale_baseline = None
+
+    def _insert_key_event(self, action: str) -> None:
+        self._append_event(
+            KeyEvent(
+                id=generate_id(),
+                kind=EventKind.KEY,
+                delay_ms=10,
+                timestamp_ns=0,
+                key="space",
+                scan_code=None,
+                action=KeyAction(action),
+            )
         )
-        macro.events.append(new_event)
-        self.timeline_model.set_events(macro.events)
-        self.timeline_view.selectRow(len(macro.events) - 1)
 
+    @Slot()
     def _insert_mouse_click(self) -> None:
-        from core.types import MouseAction, MouseEvent, EventKind
-
-        macro = self._current_macro()
-        new_event = MouseEvent(
-            id=generate_id(),
-            kind=EventKind.MOUSE,
-            delay_ms=10,
-            timestamp_ns=0,
-            action=MouseAction.DOWN,
-            button="left",
-            x=0,
-            y=0,
-            delta=None,
-        )
-        macro.events.append(new_event)
-        self.timeline_model.set_events(macro.events)
-        self.timeline_view.selectRow(len(macro.events) - 1)
+        self._insert_mouse_event(MouseAction.DOWN, button="left", x=0, y=0)
 
+    @Slot()
     def _insert_mouse_move(self) -> None:
-        from core.types import MouseAction, MouseEvent, EventKind
-
-        macro = self._current_macro()
-        new_event = MouseEvent(
-            id=generate_id(),
-            kind=EventKind.MOUSE,
-            delay_ms=10,
-            timestamp_ns=0,
-            action=MouseAction.MOVE,
-            button=None,
-            x=100,
-            y=100,
-            delta=None,
-        )
-        macro.events.append(new_event)
-        self.timeline_model.set_events(macro.events)
-        self.timeline_view.selectRow(len(macro.events) - 1)
+        self._insert_mouse_event(MouseAction.MOVE, x=100, y=100)
 
+    @Slot()
     def _insert_mouse_wheel(self) -> None:
-        from core.types import MouseAction, MouseEvent, EventKind
-
-        macro = self._current_macro()
-        new_event = MouseEvent(
-            id=generate_id(),
-            kind=EventKind.MOUSE,
-            delay_ms=10,
-            timestamp_ns=0,
-            action=MouseAction.WHEEL,
-            button=None,
-            x=0,
-            y=0,
-            delta=1,
+        self._insert_mouse_event(MouseAction.WHEEL, x=0, y=0, delta=1)
+
+    def _insert_mouse_event(
+        self,
+        action: MouseAction,
+        *,
+        button: Optional[str] = None,
+        x: int = 0,
+        y: int = 0,
+        delta: Optional[int] = None,
+    ) -> None:
+        self._append_event(
+            MouseEvent(
+                id=generate_id(),
+                kind=EventKind.MOUSE,
+                delay_ms=10,
+                timestamp_ns=0,
+                action=action,
+                button=button,
+                x=x,
+                y=y,
+                delta=delta,
+            )
         )
-        macro.events.append(new_event)
-        self.timeline_model.set_events(macro.events)
-        self.timeline_view.selectRow(len(macro.events) - 1)
 
+    def _append_event(self, event: MacroEvent) -> None:
+        # The timeline model shares the current macro's event list, so appending
+        # through the model updates the macro without resetting the view.
+        row = self.timeline_model.append_event(event)
+        self.timeline_view.selectRow(row)
+        self.timeline_view.scrollTo(self.timeline_model.index(row, 0))
+
+    @Slot()
     def _prompt_normalize(self) -> None:
         self._apply_delay_preset(25)
 
     # Binding manager -------------------------------------------------------------
     def _refresh_bindings_table(self) -> None:
-        profile = self._current_profile()
-        bindings = profile.bindings
-        self.binding_table.setRowCount(len(bindings))
-        for row, binding in enumerate(bindings):
-            btype = self._coerce_binding_type(binding.binding_type)
-            binding.binding_type = btype
-            playback = binding.playback
-            if not isinstance(playback, PlaybackOptions):
-                payload = playback if isinstance(playback, dict) else {}
-                playback = PlaybackOptions.from_dict(payload)
-                binding.playback = playback
-            playback.mode = self._coerce_playback_mode(playback.mode)
-            playback.delay_strategy = self._coerce_delay_strategy(playback.delay_strategy)
-            self.binding_table.setItem(row, 0, QTableWidgetItem(binding.hotkey))
-            self.binding_table.setItem(row, 1, QTableWidgetItem(btype.name.title()))
-            target = binding.target_id or ""
-            if btype == BindingType.TEXT:
-                target = "Text"
-            elif btype == BindingType.PROGRAM:
-                target = binding.payload or ""
-            self.binding_table.setItem(row, 2, QTableWidgetItem(target))
-            self.binding_table.setItem(row, 3, QTableWidgetItem(playback.mode.name.title()))
-        self.binding_registry.apply_bindings(bindings)
+        # Bindings are normalized once in _normalize_state, so the model only renders.
+        self.binding_model.set_bindings(self._current_profile().bindings)
+        self._apply_binding_changes()
+
+    def _apply_binding_changes(self) -> None:
+        self.binding_registry.apply_bindings(self.binding_model.bindings())
         self._populate_binding_targets()
         self._apply_autofire_bindings()
 
@@ -768,44 +868,53 @@ class MainWindow(QMainWindow):
         self._apply_autofire_bindings()
 
     def _apply_autofire_bindings(self) -> None:
+        # Several refresh paths request this within one user action; re-hook once per event-loop turn.
+        if not self._autofire_apply_timer.isActive():
+            self._autofire_apply_timer.start()
+
+    @Slot()
+    def _apply_autofire_bindings_now(self) -> None:
+        self._autofire_apply_timer.stop()
         profile = self._current_profile()
         mapping = {binding.trigger_key: binding for binding in profile.auto_fire_bindings}
-        try:
+        # Snapshot the values the registry hooks with; re-hooking identical bindings is pure churn.
+        fingerprint = tuple(
+            (b.id, b.trigger_key, b.output_key, b.interval_ms, b.pass_through_trigger, b.mode)
+            for b in mapping.values()
+        )
+        if fingerprint != self._applied_autofire_fingerprint:
+            # The registry reports hook failures through _on_autofire_error, which drops the
+            # fingerprint again so the next apply retries instead of skipping.
+            self._applied_autofire_fingerprint = fingerprint
             self.autofire_registry.apply_bindings(mapping)
-        except ValueError as exc:
-            QMessageBox.warning(self, "AutoFire", str(exc))
         if not mapping:
             self._set_autofire_status("AutoFire: idle")
 
+    @Slot()
     def _save_autofire_binding(self) -> None:
-        data = self.autofire_editor.collect_input()
-        if not data.trigger_key:
-            QMessageBox.warning(self, "AutoFire", "Trigger key is required")
-            return
-        if not data.output_key:
-            QMessageBox.warning(self, "AutoFire", "Output key is required")
+        try:
+            binding = self.autofire_editor.collect_input()
+        except ValueError as exc:
+            QMessageBox.warning(self, "AutoFire", str(exc))
             return
         profile = self._current_profile()
         conflict = next(
-            (b for b in profile.auto_fire_bindings if b.trigger_key == data.trigger_key and b.id != data.id),
+            (b for b in profile.auto_fire_bindings if b.trigger_key == binding.trigger_key and b.id != binding.id),
             None,
         )
         if conflict:
             QMessageBox.warning(
                 self,
                 "AutoFire",
-                f"Trigger '{data.trigger_key.upper()}' is already used by another AutoFire binding.",
+                f"Trigger '{binding.trigger_key.upper()}' is already used by another AutoFire binding.",
             )
             return
-        try:
-            binding = self.autofire_editor.update_binding(data)
-        except ValueError as exc:
-            QMessageBox.warning(self, "AutoFire", str(exc))
-            return
+        binding = self.autofire_editor.update_binding(binding)
         profile.auto_fire_bindings = self.autofire_editor.bindings()
         self._apply_autofire_bindings()
         self._set_status(f"AutoFire binding saved: {binding.trigger_key.upper()} -> {binding.output_key.upper()}")
 
+    @Slot()
     def _remove_autofire_binding(self) -> None:
         removed = self.autofire_editor.remove_selected()
         if removed is None:
@@ -821,29 +930,31 @@ class MainWindow(QMainWindow):
             self.autofire_status_label.setText(text)
 
     def _on_autofire_error(self, message: str) -> None:
+        self._applied_autofire_fingerprint = None
         self._set_status(message)
         QMessageBox.warning(self, "AutoFire", message)
 
-    def _on_binding_selected(self) -> None:
+    @Slot(QItemSelection, QItemSelection)
+    def _on_binding_selected(self, *_args) -> None:
         rows = self.binding_table.selectionModel().selectedRows()
         if not rows:
             return
-        row = rows[0].row()
-        binding = self._current_profile().bindings[row]
-        btype = self._coerce_binding_type(binding.binding_type)
+        binding = self.binding_model.binding_at(rows[0].row())
+        if binding is None:
+            return
+        btype = _coerce_binding_type(binding.binding_type)
         binding.binding_type = btype
         playback = binding.playback
         if not isinstance(playback, PlaybackOptions):
             payload = playback if isinstance(playback, dict) else {}
             playback = PlaybackOptions.from_dict(payload)
             binding.playback = playback
-        playback.mode = self._coerce_playback_mode(playback.mode)
-        playback.delay_strategy = self._coerce_delay_strategy(playback.delay_strategy)
+        playback.mode = _coerce_playback_mode(playback.mode)
+        playback.delay_strategy = _coerce_delay_strategy(playback.delay_strategy)
         self.binding_hotkey_edit.setText(binding.hotkey)
-        index = self.binding_type_combo.findData(btype)
-        if index < 0:
-            index = 0
-        self.binding_type_combo.setCurrentIndex(index)
+        # Populate the targets once below rather than again via _on_binding_type_changed.
+        with QSignalBlocker(self.binding_type_combo):
+            self.binding_type_combo.setCurrentIndex(BINDING_TYPE_ROWS.get(btype, 0))
         self._populate_binding_targets()
         if btype == BindingType.MACRO and binding.target_id:
             target_index = self.binding_target_combo.findData(binding.target_id)
@@ -853,39 +964,37 @@ class MainWindow(QMainWindow):
             self.binding_target_combo.setCurrentIndex(target_index)
         elif btype in (BindingType.TEXT, BindingType.PROGRAM):
             self.binding_payload_edit.setText(binding.payload or "")
-        mode_index = self.binding_mode_combo.findData(playback.mode)
-        if mode_index < 0:
-            mode_index = 0
-        self.binding_mode_combo.setCurrentIndex(mode_index)
+        self.binding_mode_combo.setCurrentIndex(PLAYBACK_MODE_ROWS.get(playback.mode, 0))
         self.binding_repeat_spin.setValue(playback.repeat_count)
         self.binding_speed_spin.setValue(playback.speed_multiplier)
         self.binding_suppress_check.setChecked(binding.suppress)
 
     def _populate_binding_targets(self) -> None:
-        btype = self._coerce_binding_type(self.binding_type_combo.currentData())
-        self.binding_target_combo.blockSignals(True)
-        self.binding_target_combo.clear()
-        if btype == BindingType.MACRO:
-            for macro in self._current_profile().macros:
-                self.binding_target_combo.addItem(macro.name, macro.id)
-            self.binding_target_combo.setEnabled(True)
-            self.binding_payload_edit.clear()
-            self.binding_payload_edit.setEnabled(False)
-        elif btype == BindingType.SYSTEM:
-            for action_id, label in SYSTEM_ACTION_IDS:
-                self.binding_target_combo.addItem(label, action_id)
-            self.binding_target_combo.setEnabled(True)
-            self.binding_payload_edit.setEnabled(True)
-        else:
-            self.binding_target_combo.setEnabled(False)
-            self.binding_payload_edit.setEnabled(True)
-        if self.binding_target_combo.count():
-            self.binding_target_combo.setCurrentIndex(0)
-        self.binding_target_combo.blockSignals(False)
-
+        btype = _coerce_binding_type(self.binding_type_combo.currentData())
+        with QSignalBlocker(self.binding_target_combo):
+            self.binding_target_combo.clear()
+            if btype == BindingType.MACRO:
+                for macro in self._current_profile().macros:
+                    self.binding_target_combo.addItem(macro.name, macro.id)
+                self.binding_target_combo.setEnabled(True)
+                self.binding_payload_edit.clear()
+                self.binding_payload_edit.setEnabled(False)
+            elif btype == BindingType.SYSTEM:
+                for action_id, label in SYSTEM_ACTION_IDS:
+                    self.binding_target_combo.addItem(label, action_id)
+                self.binding_target_combo.setEnabled(True)
+                self.binding_payload_edit.setEnabled(True)
+            else:
+                self.binding_target_combo.setEnabled(False)
+                self.binding_payload_edit.setEnabled(True)
+            if self.binding_target_combo.count():
+                self.binding_target_combo.setCurrentIndex(0)
+
+    @Slot()
     def _on_binding_type_changed(self) -> None:
         self._populate_binding_targets()
 
+    @Slot()
     def _save_binding(self) -> None:
         hotkey = self.binding_hotkey_edit.text().strip().lower()
         if not hotkey:
@@ -894,7 +1003,7 @@ class MainWindow(QMainWindow):
         if "fn" in hotkey:
             QMessageBox.warning(self, "Binding", "Fn key cannot be captured")
             return
-        btype = self._coerce_binding_type(self.binding_type_combo.currentData())
+        btype = _coerce_binding_type(self.binding_type_combo.currentData())
         target_id: Optional[str] = None
         payload: Optional[str] = None
         if btype == BindingType.MACRO:
@@ -912,7 +1021,7 @@ class MainWindow(QMainWindow):
             if not payload:
                 QMessageBox.warning(self, "Binding", "Enter the program path to launch")
                 return
-        mode = self._coerce_playback_mode(self.binding_mode_combo.currentData())
+        mode = _coerce_playback_mode(self.binding_mode_combo.currentData())
         playback = PlaybackOptions(
             mode=mode,
             repeat_count=self.binding_repeat_spin.value(),
@@ -931,56 +1040,35 @@ class MainWindow(QMainWindow):
             suppress=self.binding_suppress_check.isChecked(),
         )
         if existing:
-            profile.bindings[profile.bindings.index(existing)] = binding
+            self.binding_model.replace_row(profile.bindings.index(existing), binding)
         else:
-            profile.bindings.append(binding)
-        self._refresh_bindings_table()
+            self.binding_model.append(binding)
+        self._apply_binding_changes()
         self._set_status("Binding saved")
 
+    @Slot()
     def _remove_binding(self) -> None:
         rows = self.binding_table.selectionModel().selectedRows()
         if not rows:
             return
-        row = rows[0].row()
-        profile = self._current_profile()
-        del profile.bindings[row]
-        self._refresh_bindings_table()
+        if self.binding_model.remove_row(rows[0].row()) is None:
+            return
+        self._apply_binding_changes()
         self._set_status("Binding removed")
 
     # Helpers ---------------------------------------------------------------------
-    @staticmethod
-    def _coerce_binding_type(raw: Any) -> BindingType:
-        if isinstance(raw, BindingType):
-            return raw
-        try:
-            return BindingType(str(raw))
-        except Exception:  # noqa: BLE001
-            return BindingType.MACRO
-
-    @staticmethod
-    def _coerce_playback_mode(raw: Any) -> PlaybackMode:
-        if isinstance(raw, PlaybackMode):
-            return raw
-        try:
-            return PlaybackMode(str(raw))
-        except Exception:  # noqa: BLE001
-            return PlaybackMode.ONCE
-
-    @staticmethod
-    def _coerce_delay_strategy(raw: Any) -> DelayStrategy:
-        if isinstance(raw, DelayStrategy):
-            return raw
-        try:
-            return DelayStrategy(str(raw))
-        except Exception:  # noqa: BLE001
-            return DelayStrategy.ACTUAL
-
+    @Slot()
     def _on_model_reset(self) -> None:
         self._clear_event_properties()
 
     def _on_timeline_data_changed(self, *_) -> None:
+        if not self._applying_scale:
+            self._invalidate_scale_baseline()
+        # The displayed event may have been edited in place; force a redraw.
+        self._displayed_event = None
         self._on_timeline_selection()
 
+    @Slot(QItemSelection, QItemSelection)
     def _on_timeline_selection(self, *_args, **_kwargs) -> None:
         selection = self.timeline_view.selectionModel()
         if selection is None:
@@ -992,14 +1080,15 @@ class MainWindow(QMainWindow):
             return
         row = indexes[0].row()
         macro = self._current_macro()
-        if 0 <= row < len(macro.events):
-            self._display_event_properties(macro.events[row])
-        else:
+        if not 0 <= row < len(macro.events):
             self._clear_event_properties()
+            return
+        event = macro.events[row]
+        if event is not self._displayed_event:
+            self._display_event_properties(event)
 
-    def _display_event_properties(self, event) -> None:
-        from core.types import KeyEvent, MouseEvent
-
+    def _display_event_properties(self, event: MacroEvent) -> None:
+        self._displayed_event = event
         if isinstance(event, KeyEvent):
             self.prop_type.setText("Key Event")
             self.prop_action.setText(event.action.value)
@@ -1020,6 +1109,7 @@ class MainWindow(QMainWindow):
             self._clear_event_properties()
 
     def _clear_event_properties(self) -> None:
+        self._displayed_event = None
         self.prop_type.setText("-")
         self.prop_action.setText("-")
         self.prop_key.setText("-")
@@ -1043,6 +1133,7 @@ class MainWindow(QMainWindow):
         except StorageError as exc:
             QMessageBox.warning(self, "Save Failed", str(exc))
         finally:
+            self._autofire_apply_timer.stop()
             keyboard.remove_hotkey(self._emergency_hotkey_id)
             self.binding_registry.clear()
             self.player.stop()
@@ -0,0 +1,105 @@
+"""Qt model listing AutoFire bindings for the editor table."""
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from core.types import AutoFireBinding
+
+PASS_THROUGH_LABELS = ("OFF", "ON")
+
+COLUMN_HEADERS = [
+    "Trigger",
+    "Output",
+    "Interval (ms)",
+    "Pass-through",
+]
+
+
+class AutoFireModel(QAbstractTableModel):
+    ITEM_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def __init__(self, bindings: Optional[List[AutoFireBinding]] = None, parent=None) -> None:
+        super().__init__(parent)
+        self._bindings: List[AutoFireBinding] = list(bindings) if bindings is not None else []
+        self._row_by_id: Dict[str, int] = {}
+        self._reindex()
+
+    # Qt overrides -----------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._bindings)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return len(COLUMN_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if role != Qt.DisplayRole or not index.isValid() or not (0 <= index.row() < len(self._bindings)):
+            return None
+        return self._data_for_column(self._bindings[index.row()], index.column())
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMN_HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex):  # type: ignore[override]
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return self.ITEM_FLAGS
+
+    # Helpers ----------------------------------------------------------------------
+    def bindings(self) -> List[AutoFireBinding]:
+        return list(self._bindings)
+
+    def binding_at(self, row: int) -> Optional[AutoFireBinding]:
+        if 0 <= row < len(self._bindings):
+            return self._bindings[row]
+        return None
+
+    def row_of(self, binding_id: str) -> int:
+        return self._row_by_id.get(binding_id, -1)
+
+    def set_bindings(self, bindings: List[AutoFireBinding]) -> None:
+        self.beginResetModel()
+        self._bindings = list(bindings)
+        self._reindex()
+        self.endResetModel()
+
+    def upsert(self, binding: AutoFireBinding) -> int:
+        row = self.row_of(binding.id)
+        if row >= 0:
+            self._bindings[row] = binding
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMN_HEADERS) - 1), [Qt.DisplayRole])
+            return row
+        row = len(self._bindings)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._bindings.append(binding)
+        self._row_by_id[binding.id] = row
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row: int) -> Optional[AutoFireBinding]:
+        if not (0 <= row < len(self._bindings)):
+            return None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        binding = self._bindings.pop(row)
+        self._reindex()
+        self.endRemoveRows()
+        return binding
+
+    def _reindex(self) -> None:
+        self._row_by_id = {binding.id: row for row, binding in enumerate(self._bindings)}
+
+    def _data_for_column(self, binding: AutoFireBinding, column: int):
+        if column == 0:
+            return binding.trigger_key.upper()
+        if column == 1:
+            return binding.output_key.upper()
+        if column == 2:
+            return binding.interval_ms
+        if column == 3:
+            return PASS_THROUGH_LABELS[binding.pass_through_trigger]
+        return None
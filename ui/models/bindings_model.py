@@ -0,0 +1,100 @@
+"""Qt model listing hotkey bindings for the binding manager table."""
+from __future__ import annotations
+
+from typing import List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from core.types import Binding, BindingType, PlaybackMode
+
+COLUMN_HEADERS = [
+    "Hotkey",
+    "Type",
+    "Target",
+    "Mode",
+]
+
+BINDING_TYPE_LABELS = {btype: btype.name.title() for btype in BindingType}
+PLAYBACK_MODE_LABELS = {mode: mode.name.title() for mode in PlaybackMode}
+
+
+class BindingsModel(QAbstractTableModel):
+    ITEM_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def __init__(self, bindings: Optional[List[Binding]] = None, parent=None) -> None:
+        super().__init__(parent)
+        self._bindings: List[Binding] = bindings if bindings is not None else []
+
+    # Qt overrides -----------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._bindings)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return len(COLUMN_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if role != Qt.DisplayRole or not index.isValid() or not (0 <= index.row() < len(self._bindings)):
+            return None
+        return self._data_for_column(self._bindings[index.row()], index.column())
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMN_HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex):  # type: ignore[override]
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return self.ITEM_FLAGS
+
+    # Helpers ----------------------------------------------------------------------
+    def bindings(self) -> List[Binding]:
+        return list(self._bindings)
+
+    def binding_at(self, row: int) -> Optional[Binding]:
+        if 0 <= row < len(self._bindings):
+            return self._bindings[row]
+        return None
+
+    def set_bindings(self, bindings: List[Binding]) -> None:
+        self.beginResetModel()
+        self._bindings = bindings
+        self.endResetModel()
+
+    def replace_row(self, row: int, binding: Binding) -> None:
+        if not (0 <= row < len(self._bindings)):
+            return
+        self._bindings[row] = binding
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMN_HEADERS) - 1), [Qt.DisplayRole])
+
+    def append(self, binding: Binding) -> int:
+        row = len(self._bindings)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._bindings.append(binding)
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row: int) -> Optional[Binding]:
+        if not (0 <= row < len(self._bindings)):
+            return None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        binding = self._bindings.pop(row)
+        self.endRemoveRows()
+        return binding
+
+    def _data_for_column(self, binding: Binding, column: int):
+        if column == 0:
+            return binding.hotkey
+        if column == 1:
+            return BINDING_TYPE_LABELS[binding.binding_type]
+        if column == 2:
+            if binding.binding_type == BindingType.TEXT:
+                return "Text"
+            if binding.binding_type == BindingType.PROGRAM:
+                return binding.payload or ""
+            return binding.target_id or ""
+        if column == 3:
+            return PLAYBACK_MODE_LABELS[binding.playback.mode]
+        return None
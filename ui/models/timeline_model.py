@@ -1,7 +1,7 @@
 """Qt model representing macro events in a tabular timeline."""
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
@@ -24,6 +24,18 @@ class TimelineModel(QAbstractTableModel):
     def __init__(self, events: Optional[List[MacroEvent]] = None, parent=None) -> None:
         super().__init__(parent)
         self._events: List[MacroEvent] = events if events is not None else []
+        # One getter per column, in COLUMN_HEADERS order, so data() indexes instead of branching.
+        self._column_getters: Tuple[Callable[[MacroEvent, int], Any], ...] = (
+            self._column_number,
+            self._column_type,
+            self._column_device,
+            self._column_action,
+            self._column_key,
+            self._column_x,
+            self._column_y,
+            self._column_delta,
+            self._column_delay,
+        )
 
     # Qt overrides -----------------------------------------------------------------
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
@@ -35,14 +47,15 @@ class TimelineModel(QAbstractTableModel):
         return len(COLUMN_HEADERS)
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
-        if not index.isValid() or not (0 <= index.row() < len(self._events)):
+        if role != Qt.DisplayRole and role != Qt.EditRole:
             return None
         row = index.row()
-        event = self._events[row]
+        if not index.isValid() or not (0 <= row < len(self._events)):
+            return None
         column = index.column()
-        if role in (Qt.DisplayRole, Qt.EditRole):
-            return self._data_for_column(event, column, row)
-        return None
+        if not (0 <= column < len(self._column_getters)):
+            return ""
+        return self._column_getters[column](self._events[row], row)
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
@@ -80,6 +93,13 @@ class TimelineModel(QAbstractTableModel):
         self._events = events
         self.endResetModel()
 
+    def append_event(self, event: MacroEvent) -> int:
+        row = len(self._events)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._events.append(event)
+        self.endInsertRows()
+        return row
+
     def insert_event(self, position: int, event: MacroEvent) -> None:
         self.beginInsertRows(QModelIndex(), position, position)
         self._events.insert(position, event)
@@ -110,7 +130,9 @@ class TimelineModel(QAbstractTableModel):
             return
         selection = [self._events[row] for row in unique_rows]
         original_target = max(0, min(target, len(self._events)))
-        self.beginResetModel()
+        # A layout change keeps persistent indexes (and so the view's selection) attached to their events.
+        self.layoutAboutToBeChanged.emit()
+        previous_order = list(self._events)
         for row in reversed(unique_rows):
             del self._events[row]
         adjusted_target = original_target
@@ -118,9 +140,14 @@ class TimelineModel(QAbstractTableModel):
             if row < original_target:
                 adjusted_target -= 1
         adjusted_target = max(0, min(adjusted_target, len(self._events)))
-        for offset, event in enumerate(selection):
-            self._events.insert(adjusted_target + offset, event)
-        self.endResetModel()
+        self._events[adjusted_target:adjusted_target] = selection
+        new_row_of = {id(event): row for row, event in enumerate(self._events)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(new_row_of[id(previous_order[index.row()])], index.column()) for index in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
 
     def normalize_delays(self, value: int) -> None:
         for event in self._events[1:]:
@@ -131,44 +158,64 @@ class TimelineModel(QAbstractTableModel):
         bottom_right = self.index(max(0, len(self._events) - 1), 8)
         self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.EditRole])
 
-    def scale_delays(self, factor: float) -> None:
-        for event in self._events:
-            event.delay_ms = max(0, int(round(event.delay_ms * factor)))
+    def delays(self) -> List[int]:
+        return [event.delay_ms for event in self._events]
+
+    def scale_delays(self, factor: float, baseline: Optional[Sequence[int]] = None) -> None:
+        """Scale delays by ``factor``, from ``baseline`` (one delay per event) when given."""
+        if baseline is None:
+            baseline = self.delays()
+        elif len(baseline) != len(self._events):
+            raise ValueError("Baseline must hold one delay per event")
+        for event, delay in zip(self._events, baseline):
+            event.delay_ms = max(0, int(round(delay * factor)))
         if self._events:
             self._events[0].delay_ms = 0
         top_left = self.index(0, 8)
         bottom_right = self.index(max(0, len(self._events) - 1), 8)
         self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.EditRole])
 
-    def _data_for_column(self, event: MacroEvent, column: int, row: int):
-        if column == 0:
-            return row + 1
-        if column == 1:
-            return event.__class__.__name__
-        if column == 2:
-            return "Keyboard" if isinstance(event, KeyEvent) else "Mouse"
-        if column == 3:
-            if isinstance(event, KeyEvent):
-                return event.action.value
-            if isinstance(event, MouseEvent):
-                return event.action.value
-        if column == 4:
-            if isinstance(event, KeyEvent):
-                return event.key
-            if isinstance(event, MouseEvent):
-                return event.button or ""
-        if column == 5:
-            if isinstance(event, MouseEvent) and event.x is not None:
-                return event.x
-            return ""
-        if column == 6:
-            if isinstance(event, MouseEvent) and event.y is not None:
-                return event.y
-            return ""
-        if column == 7:
-            if isinstance(event, MouseEvent) and event.delta is not None:
-                return event.delta
-            return ""
-        if column == 8:
-            return event.delay_ms
-        return ""
\ No newline at end of file
+    # Column getters -----------------------------------------------------------
+    @staticmethod
+    def _column_number(event: MacroEvent, row: int) -> int:
+        return row + 1
+
+    @staticmethod
+    def _column_type(event: MacroEvent, row: int) -> str:
+        return event.__class__.__name__
+
+    @staticmethod
+    def _column_device(event: MacroEvent, row: int) -> str:
+        return "Keyboard" if isinstance(event, KeyEvent) else "Mouse"
+
+    @staticmethod
+    def _column_action(event: MacroEvent, row: int) -> str:
+        return event.action.value
+
+    @staticmethod
+    def _column_key(event: MacroEvent, row: int) -> str:
+        if isinstance(event, KeyEvent):
+            return event.key
+        return event.button or ""
+
+    @staticmethod
+    def _column_x(event: MacroEvent, row: int):
+        if isinstance(event, MouseEvent) and event.x is not None:
+            return event.x
+        return ""
+
+    @staticmethod
+    def _column_y(event: MacroEvent, row: int):
+        if isinstance(event, MouseEvent) and event.y is not None:
+            return event.y
+        return ""
+
+    @staticmethod
+    def _column_delta(event: MacroEvent, row: int):
+        if isinstance(event, MouseEvent) and event.delta is not None:
+            return event.delta
+        return ""
+
+    @staticmethod
+    def _column_delay(event: MacroEvent, row: int) -> int:
+        return event.delay_ms
@@ -1,6 +1,7 @@
 """Custom view for the timeline table."""
 from __future__ import annotations
 
+from array import array
 from typing import List
 
 from PySide6.QtCore import QMimeData, QModelIndex, Qt
@@ -9,6 +10,8 @@ from PySide6.QtWidgets import QAbstractItemView, QTableView
 
 from ui.models.timeline_model import TimelineModel
 
+TIMELINE_ROWS_MIME = "application/x-timeline-rows"
+
 
 class TimelineView(QTableView):
     def __init__(self, parent=None) -> None:
@@ -29,18 +32,19 @@ class TimelineView(QTableView):
         drag = QDrag(self)
         mime = QMimeData()
         rows = sorted({index.row() for index in indexes})
-        mime.setData("application/x-timeline-rows", bytes(",".join(map(str, rows)), "utf-8"))
+        # Rows travel as a native int array; the payload never leaves this process.
+        mime.setData(TIMELINE_ROWS_MIME, array("i", rows).tobytes())
         drag.setMimeData(mime)
         drag.exec(Qt.MoveAction)
 
     def dragEnterEvent(self, event) -> None:  # type: ignore[override]
-        if event.mimeData().hasFormat("application/x-timeline-rows"):
+        if event.mimeData().hasFormat(TIMELINE_ROWS_MIME):
             event.acceptProposedAction()
         else:
             super().dragEnterEvent(event)
 
     def dragMoveEvent(self, event) -> None:  # type: ignore[override]
-        if event.mimeData().hasFormat("application/x-timeline-rows"):
+        if event.mimeData().hasFormat(TIMELINE_ROWS_MIME):
             event.acceptProposedAction()
         else:
             super().dragMoveEvent(event)
@@ -50,13 +54,12 @@ class TimelineView(QTableView):
         if not isinstance(model, TimelineModel):
             super().dropEvent(event)
             return
-        if event.mimeData().hasFormat("application/x-timeline-rows"):
-            data_bytes = event.mimeData().data("application/x-timeline-rows").data()
-            rows_data = data_bytes.decode()
-            rows = [int(r) for r in rows_data.split(",") if r]
+        if event.mimeData().hasFormat(TIMELINE_ROWS_MIME):
+            rows = array("i")
+            rows.frombytes(event.mimeData().data(TIMELINE_ROWS_MIME).data())
             target_index = self.indexAt(event.position().toPoint())
             target_row = target_index.row() if target_index.isValid() else len(model.events())
-            model.reorder_rows(rows, target_row)
+            model.reorder_rows(rows.tolist(), target_row)
             event.acceptProposedAction()
         else:
             super().dropEvent(event)